@@ -1,29 +1,62 @@
 import json
+import os
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+# Use orjson when available; fall back to stdlib json
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+# slots keep each contact small and make field access a fixed offset
+# load instead of a dict lookup
+@dataclass(slots=True)
+class Contact:
+    name: str
+    phone: str
+
 contacts = []
 
 try:
-    with open("contacts.json", "r") as f:
-        contacts = json.load(f)
+    contacts = [Contact(**c) for c in _json_loads(Path("contacts.json").read_bytes())]
 except FileNotFoundError:
     contacts = []
 
 def add_contact():
-    name = input("Enter name: ")
-    phone = input("Enter phone number: ")
-    contact = {
-        "name": name,
-        "phone": phone
-    }
-    contacts.append(contact)
+    if sys.stdin.isatty():
+        name = input("Enter name: ")
+        phone = input("Enter phone number: ")
+    else:
+        # piped input: one "name,phone" line per contact
+        name, phone = sys.stdin.readline().rstrip("\n").split(",", 1)
+    contacts.append(Contact(name, phone))
     print("Contact added!")
 
 def view_contacts():
-    for c in contacts:
-        print("Name:", c["name"], "- Phone:", c["phone"])
+    # build the whole listing and write it once instead of one print per contact
+    if contacts:
+        sys.stdout.write("\n".join(f"Name: {c.name} - Phone: {c.phone}" for c in contacts) + "\n")
 
 def save_contacts():
-    with open("contacts.json", "w") as f:
-        json.dump(contacts, f, indent=4)
+    # temp file + rename so a crash mid-write can't corrupt the book
+    data = _json_dumps([asdict(c) for c in contacts])
+    with open("contacts.json.tmp", "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace("contacts.json.tmp", "contacts.json")
 
 while True:
     print("\n1. Add Contact")
@@ -6,64 +6,167 @@ Features:
 - View all expenses, filter by category/date range
 - Totals and summary by category/date range
 - Edit and delete expenses
-- Save/load from JSON (auto-save after each write)
+- Save/load from JSON (append-only op log + snapshot on exit)
 - Simple search and CSV export
 """
 
 import json
 import csv
-from datetime import datetime
+import heapq
+import os
+import sys
+from collections import defaultdict
+from datetime import date, datetime
 from pathlib import Path
 from typing import List, Dict, Optional
 
 DATA_FILE = Path("expenses.json")
 
+# Use orjson for load/save when available; fall back to stdlib json
+try:
+    import orjson
+
+    def _json_loads(data: bytes):
+        return orjson.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _json_loads(data: bytes):
+        return json.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+# compact the op log into a fresh snapshot once it grows past this
+LOG_COMPACT_BYTES = 64 * 1024
+
 
 def parse_date(text: str) -> datetime:
     text = text.strip()
     if not text or text.lower() in ("today", "t"):
         return datetime.today()
-    for fmt in ("%Y-%m-%d", "%d-%m-%Y", "%d/%m/%Y"):
+    # fast path: YYYY-MM-DD (and other ISO forms) hit CPython's C parser
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        pass
+    for fmt in ("%d-%m-%Y", "%d/%m/%Y"):
         try:
             return datetime.strptime(text, fmt)
         except ValueError:
             continue
-    # last resort: try iso parse
-    try:
-        return datetime.fromisoformat(text)
-    except Exception:
-        raise ValueError("Date format not recognized. Use YYYY-MM-DD or DD-MM-YYYY or leave empty for today.")
+    raise ValueError("Date format not recognized. Use YYYY-MM-DD or DD-MM-YYYY or leave empty for today.")
 
 
 class ExpenseTracker:
     def __init__(self, path: Path = DATA_FILE):
         self.path = path
+        self.log_path = path.with_suffix(".log")
         self.expenses = []
+        self._by_id = {}
+        self._max_id = 0
+        self._tombstones = 0
+        self._dirty = False
+        self._autosave = True
         self._load()
 
     def _load(self):
         if self.path.exists():
             try:
-                with open(self.path, "r", encoding="utf-8") as f:
-                    self.expenses = json.load(f)
-                # ensure proper types
+                self.expenses = _json_loads(self.path.read_bytes())
+                # ensure proper types and cache derived fields
                 for e in self.expenses:
                     e["amount"] = float(e["amount"])
-                    e["date"] = e["date"]  # stored as string
+                    self._cache_derived(e)
             except Exception as exc:
                 print("Warning: could not load file:", exc)
                 self.expenses = []
         else:
             self.expenses = []
+        self._replay_log()
+        self._rebuild_index()
+
+    @staticmethod
+    def _cache_derived(e: Dict):
+        # fields the hot paths read per row, so filters and search don't
+        # re-parse/re-casefold every call; stripped again before saving
+        e["_d"] = date.fromisoformat(e["date"]).toordinal()
+        e["_cat_lc"] = e["category"].casefold()
+        e["_note_lc"] = e.get("note", "").casefold()
+
+    def _replay_log(self):
+        # apply any operations logged since the last snapshot
+        if not self.log_path.exists():
+            return
+        by_id = {e["id"]: e for e in self.expenses}
+        try:
+            for line in self.log_path.read_bytes().splitlines():
+                if not line.strip():
+                    continue
+                rec = _json_loads(line)
+                op = rec.pop("op", None)
+                if op == "add":
+                    rec["amount"] = float(rec["amount"])
+                    self._cache_derived(rec)
+                    self.expenses.append(rec)
+                    by_id[rec["id"]] = rec
+                elif op == "edit" and rec["id"] in by_id:
+                    e = by_id[rec["id"]]
+                    e.update(rec)
+                    self._cache_derived(e)
+                elif op == "delete" and rec["id"] in by_id:
+                    by_id.pop(rec["id"])["_deleted"] = True
+            self._dirty = True
+        except Exception as exc:
+            print("Warning: could not replay log:", exc)
+
+    def _rebuild_index(self):
+        # id -> expense map and running max id, so lookups and id
+        # generation don't scan the whole list
+        self._by_id = {e["id"]: e for e in self._live()}
+        self._max_id = max((int(e["id"]) for e in self._live()), default=0)
+        self._tombstones = len(self.expenses) - len(self._by_id)
+
+    def _live(self):
+        # live rows only; deletes leave tombstones until compaction
+        return (e for e in self.expenses if "_deleted" not in e)
 
     def _save(self):
-        with open(self.path, "w", encoding="utf-8") as f:
-            json.dump(self.expenses, f, indent=2, ensure_ascii=False)
+        # compact away tombstones, then drop the cached "_"-prefixed
+        # fields; they are derived
+        self.expenses = [e for e in self._live()]
+        self._tombstones = 0
+        rows = [{k: v for k, v in e.items() if not k.startswith("_")} for e in self.expenses]
+        # write to a temp file and rename over the old snapshot, so a
+        # crash mid-write can never leave a torn expenses.json
+        tmp = self.path.with_suffix(".json.tmp")
+        with open(tmp, "wb") as f:
+            f.write(_json_dumps(rows))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        # the snapshot now covers everything, so the op log starts over
+        self.log_path.unlink(missing_ok=True)
+        self._dirty = False
+
+    def _log_op(self, record: Dict):
+        # append one operation to the log instead of rewriting the whole
+        # snapshot; skipped while autosave is off (e.g. during bulk import)
+        self._dirty = True
+        if not self._autosave:
+            return
+        with open(self.log_path, "ab") as f:
+            f.write(_json_dumps(record) + b"\n")
+        if self.log_path.stat().st_size > LOG_COMPACT_BYTES:
+            self._save()
+
+    def flush(self):
+        if self._dirty:
+            self._save()
 
     def _next_id(self) -> int:
-        if not self.expenses:
-            return 1
-        return max(int(e["id"]) for e in self.expenses) + 1
+        return self._max_id + 1
 
     def add_expense(self, amount: float, category: str, date: datetime, note: str = "") -> Dict:
         expense = {
@@ -73,26 +176,36 @@ class ExpenseTracker:
             "date": date.strftime("%Y-%m-%d"),
             "note": note.strip()
         }
+        self._cache_derived(expense)
         self.expenses.append(expense)
-        self._save()
+        self._by_id[expense["id"]] = expense
+        self._max_id = int(expense["id"])
+        self._log_op({"op": "add", **{k: v for k, v in expense.items() if not k.startswith("_")}})
         return expense
 
     def list_expenses(self, limit: Optional[int] = None) -> List[Dict]:
-        sorted_list = sorted(self.expenses, key=lambda x: x["date"], reverse=True)
+        # for a small limit a partial sort via nlargest beats sorting
+        # the whole list just to slice it
+        if limit and limit < len(self.expenses) // 4:
+            return heapq.nlargest(limit, self._live(), key=lambda x: x["date"])
+        sorted_list = sorted(self._live(), key=lambda x: x["date"], reverse=True)
         return sorted_list[:limit] if limit else sorted_list
 
     def find_by_id(self, id_str: str) -> Optional[Dict]:
-        for e in self.expenses:
-            if e["id"] == id_str:
-                return e
-        return None
+        return self._by_id.get(id_str)
 
     def delete_expense(self, id_str: str) -> bool:
         e = self.find_by_id(id_str)
         if not e:
             return False
-        self.expenses.remove(e)
-        self._save()
+        del self._by_id[id_str]
+        # O(1): leave a tombstone instead of shifting the whole list
+        e["_deleted"] = True
+        self._tombstones += 1
+        self._log_op({"op": "delete", "id": id_str})
+        # compact once tombstones pile up past ~30% of the list
+        if self._autosave and self._tombstones * 10 > len(self.expenses) * 3:
+            self._save()
         return True
 
     def edit_expense(self, id_str: str, amount: Optional[float] = None,
@@ -109,71 +222,81 @@ class ExpenseTracker:
             e["date"] = date.strftime("%Y-%m-%d")
         if note is not None:
             e["note"] = note
-        self._save()
+        self._cache_derived(e)
+        self._log_op({"op": "edit", **{k: v for k, v in e.items() if not k.startswith("_")}})
         return True
 
-    def filter_expenses(self, category: Optional[str] = None, start: Optional[datetime] = None,
-                        end: Optional[datetime] = None) -> List[Dict]:
-        res = []
-        for e in self.expenses:
-            ed = datetime.strptime(e["date"], "%Y-%m-%d")
-            if category and e["category"].lower() != category.lower():
+    def _select(self, category: Optional[str] = None, start: Optional[datetime] = None,
+                end: Optional[datetime] = None):
+        # yield matching rows without sorting; date bounds compare
+        # against the cached ordinal, so no parsing per row
+        cat = category.casefold() if category else None
+        start_ord = start.toordinal() if start else None
+        end_ord = end.toordinal() if end else None
+        for e in self._live():
+            if cat and e["_cat_lc"] != cat:
                 continue
-            if start and ed < start:
+            if start_ord and e["_d"] < start_ord:
                 continue
-            if end and ed > end:
+            if end_ord and e["_d"] > end_ord:
                 continue
-            res.append(e)
-        return sorted(res, key=lambda x: x["date"], reverse=True)
+            yield e
+
+    def filter_expenses(self, category: Optional[str] = None, start: Optional[datetime] = None,
+                        end: Optional[datetime] = None) -> List[Dict]:
+        return sorted(self._select(category, start, end), key=lambda x: x["date"], reverse=True)
 
     def total(self, category: Optional[str] = None, start: Optional[datetime] = None,
               end: Optional[datetime] = None) -> float:
-        selected = self.filter_expenses(category, start, end)
-        return sum(float(e["amount"]) for e in selected)
+        return sum(float(e["amount"]) for e in self._select(category, start, end))
 
     def summary_by_category(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> Dict[str, float]:
-        selected = self.filter_expenses(None, start, end)
-        summary = {}
-        for e in selected:
-            summary[e["category"]] = summary.get(e["category"], 0.0) + float(e["amount"])
-        return summary
+        summary = defaultdict(float)
+        for e in self._select(None, start, end):
+            summary[e["category"]] += float(e["amount"])
+        return dict(summary)
 
     def search(self, term: str) -> List[Dict]:
-        t = term.lower()
-        return [e for e in self.expenses if t in e.get("note", "").lower() or t in e.get("category", "").lower()]
+        t = term.casefold()
+        return [e for e in self._live() if t in e["_note_lc"] or t in e["_cat_lc"]]
 
     def export_csv(self, filename: str = "expenses_export.csv"):
         keys = ["id", "date", "category", "amount", "note"]
         with open(filename, "w", newline='', encoding="utf-8") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=keys)
-            writer.writeheader()
-            for e in self.list_expenses():
-                writer.writerow({k: e.get(k, "") for k in keys})
+            writer = csv.writer(csvfile)
+            writer.writerow(keys)
+            writer.writerows((e["id"], e["date"], e["category"], e["amount"], e.get("note", ""))
+                             for e in self.list_expenses())
         return filename
 
     def import_from_json(self, filename: str):
         p = Path(filename)
         if not p.exists():
             raise FileNotFoundError(filename)
-        with open(p, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        # append with new ids
-        for e in data:
-            try:
-                self.add_expense(float(e["amount"]), e.get("category", "uncategorized"),
-                                 parse_date(e.get("date", "")), e.get("note", ""))
-            except Exception:
-                continue
+        data = _json_loads(p.read_bytes())
+        # append with new ids; save once at the end instead of per record
+        self._autosave = False
+        try:
+            for e in data:
+                try:
+                    self.add_expense(float(e["amount"]), e.get("category", "uncategorized"),
+                                     parse_date(e.get("date", "")), e.get("note", ""))
+                except Exception:
+                    continue
+        finally:
+            self._autosave = True
+            self.flush()
 
 
 def pretty_print_list(expenses: List[Dict]):
     if not expenses:
         print("No expenses found.")
         return
-    print(f"{'ID':<4} {'DATE':<12} {'CATEGORY':<15} {'AMOUNT':>8}  NOTE")
-    print("-" * 60)
-    for e in expenses:
-        print(f"{e['id']:<4} {e['date']:<12} {e['category']:<15} {float(e['amount']):>8.2f}  {e.get('note','')}")
+    # build the whole table and write it once instead of one print per row
+    lines = [f"{'ID':<4} {'DATE':<12} {'CATEGORY':<15} {'AMOUNT':>8}  NOTE", "-" * 60]
+    lines.extend(f"{e['id']:<4} {e['date']:<12} {e['category']:<15} {float(e['amount']):>8.2f}  {e.get('note','')}"
+                 for e in expenses)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def cli():
@@ -279,6 +402,7 @@ def cli():
                 print("Import error:", exc)
 
         elif choice == "0":
+            t.flush()
             print("Bye — data saved.")
             break
 
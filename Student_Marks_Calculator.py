@@ -1,31 +1,28 @@
+import bisect
+
 # Take inputs
 name = input("Enter student name: ")
 
-# Store marks in a list
-marks = []
-for i in range(5):
-    m = float(input(f"Enter mark {i+1}:"))
-    marks.append(m)
+# Read all 5 marks from one line (one read instead of 5 input() calls)
+marks = [float(m) for m in input("Enter 5 marks separated by spaces: ").split()]
 
 # Create functions
 def calc_total(marks):
     return sum(marks)
 def calc_percentage(total):
-    return total / 5
+    return total / len(marks)
+
+# Find grade (threshold table + binary search instead of an if-chain)
+GRADE_THRESHOLDS = [60, 70, 80, 90]
+GRADE_NAMES = ["Fail", "c", "B", "A", "A+"]
 
-# Find grade
 def calc_grade(percentage):
-    if percentage >= 90:
-        return "A+"
-    elif percentage >= 80:
-        return "A"
-    elif percentage >= 70:
-        return "B"
-    elif percentage >= 60:
-        return "c"
-    else:
-        return "Fail"
-    
+    return GRADE_NAMES[bisect.bisect_right(GRADE_THRESHOLDS, percentage)]
+
+# Grade a whole batch of percentages in one call
+def calc_grades(percentages):
+    return [calc_grade(p) for p in percentages]
+
 # Combine everything
 total = calc_total(marks)
 percentage = calc_percentage(total)